@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .api import QuotasAPI
 from .const import (
@@ -14,8 +16,19 @@ from .const import (
     CONF_DOMAIN,
     CONF_USERNAME,
     CONF_PASSWORD,
+    CONF_ACCOUNTS,
+    CONNECTION_KEYS,
 )
 from .coordinator import DirectAdminQuotasUpdateCoordinator
+from .services import async_setup_services
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the DirectAdmin quotas services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -52,9 +65,23 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        config_entry, PLATFORMS
+    )
+    if unload_ok:
+        # The services only act on the coordinators of loaded entries
+        hass.data[DOMAIN].pop(config_entry.entry_id)
+    return unload_ok
 
 
 async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    """Reload config entry, or only sync the accounts if nothing else changed."""
+    coordinator: DirectAdminQuotasUpdateCoordinator = hass.data[DOMAIN][
+        config_entry.entry_id
+    ]
+    connection_data = {key: config_entry.data.get(key) for key in CONNECTION_KEYS}
+    if connection_data != coordinator.connection_data:
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
+
+    coordinator.async_sync_accounts(config_entry.data.get(CONF_ACCOUNTS, []))
@@ -45,8 +45,8 @@ class QuotasAPI:
         if self._hostname:
             self.__check_hostname()
 
-    async def get_quotas(self):
-        """Get the quotas for all mailboxes."""
+    async def get_quotas(self) -> dict | None:
+        """Get the quotas for all mailboxes, or None when fetching failed."""
         try:
             await self.update_quotas()
         except (ClientConnectorDNSError, DirectAdminConnectionError):
@@ -54,10 +54,10 @@ class QuotasAPI:
             return
         except ConnectionTimeoutError:
             _LOGGER.error("Connection timed out while fetching quotas.")
-            return {}
+            return
         except Exception as e:
             _LOGGER.error("Unexpected error: Failed to fetch quotas: %s", e)
-            return {}
+            return
         return self._quotas
 
     async def get_domains(self):
@@ -69,8 +69,11 @@ class QuotasAPI:
 
     async def update_quotas(self):
         """Update the quotas for all mailboxes."""
+        # An error must not be mistaken for a domain without mailboxes
         json_data = await self.send_request(
-            "CMD_API_POP", {"action": "list", "domain": self._domain, "type": "quota"}
+            "CMD_API_POP",
+            {"action": "list", "domain": self._domain, "type": "quota"},
+            raise_on_error=True,
         )
         quotas = {}
         for account, value in json_data.items():
@@ -123,7 +126,9 @@ class QuotasAPI:
                 f"Domain {self._domain} is not valid or does not exist."
             )
 
-    async def send_request(self, function: str, payload: dict | None = None) -> dict:
+    async def send_request(
+        self, function: str, payload: dict | None = None, raise_on_error: bool = False
+    ) -> dict:
         response = await self._session.post(
             f"https://{self._hostname}:{self._port}/{function}",
             auth=BasicAuth(self._username, self._password),
@@ -137,6 +142,10 @@ class QuotasAPI:
                 self._hostname,
                 response.content,
             )
+            if raise_on_error:
+                raise DirectAdminConnectionError(
+                    f"Server responded with http code {response.status}"
+                )
             return {}
         return await response.json()
 
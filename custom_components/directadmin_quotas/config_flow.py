@@ -14,7 +14,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigFlowResult
 from homeassistant.core import callback
-from homeassistant.helpers import config_validation, device_registry as dr
+from homeassistant.helpers import config_validation
 
 from .const import (
     DOMAIN,
@@ -24,6 +24,9 @@ from .const import (
     CONF_USERNAME,
     CONF_PASSWORD,
     CONF_ACCOUNTS,
+    CONF_AUTO_TRACK,
+    CONF_STALE_GRACE_PERIOD,
+    DEFAULT_STALE_GRACE_PERIOD,
 )
 from .api import (
     QuotasAPI,
@@ -56,26 +59,11 @@ class DirectAdminQuotasOptionsFlowHandler(config_entries.OptionsFlow):
         entry = self.config_entry
 
         if user_input is not None:
-            new_accounts = user_input.get(CONF_ACCOUNTS, [])
-            old_accounts = entry.data.get(CONF_ACCOUNTS, [])
-            device_registry = dr.async_get(self.hass)
-            if removed_accounts := set(old_accounts) - set(new_accounts):
-                for account in removed_accounts:
-                    device = device_registry.async_get_device(
-                        identifiers={(DOMAIN, account)}
-                    )
-                    if device:
-                        _LOGGER.debug("Removing device: %s", device)
-                        device_registry.async_update_device(
-                            device_id=device.id,
-                            remove_config_entry_id=entry.entry_id,
-                        )
-
+            # The update listener adds and removes the changed accounts
             self.hass.config_entries.async_update_entry(
                 entry,
                 data=entry.data | user_input,  # type: ignore
             )
-            await self.hass.config_entries.async_reload(entry.entry_id)  # type: ignore
             return self.async_abort(reason="changes_successful")
 
         hostname = entry.data.get(CONF_HOSTNAME, "")
@@ -98,7 +86,13 @@ class DirectAdminQuotasOptionsFlowHandler(config_entries.OptionsFlow):
                 accounts.append(account)
 
         data_schema = vol.Schema(
-            {vol.Required(CONF_ACCOUNTS): config_validation.multi_select(accounts)}
+            {
+                vol.Required(CONF_ACCOUNTS): config_validation.multi_select(accounts),
+                vol.Optional(CONF_AUTO_TRACK, default=False): bool,
+                vol.Optional(
+                    CONF_STALE_GRACE_PERIOD, default=DEFAULT_STALE_GRACE_PERIOD
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            }
         )
 
         return self.async_show_form(
@@ -233,6 +227,7 @@ class DirectAdminQuotasConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Create all the devices and entities
             selected_accounts = user_input[CONF_ACCOUNTS]
             self._config[CONF_ACCOUNTS] = selected_accounts
+            self._config[CONF_AUTO_TRACK] = user_input.get(CONF_AUTO_TRACK, False)
             return self.async_create_entry(
                 title=f"{self._config[CONF_DOMAIN]}", data=self._config
             )
@@ -252,7 +247,10 @@ class DirectAdminQuotasConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 accounts.append(account)
 
         data_schema = vol.Schema(
-            {vol.Required(CONF_ACCOUNTS): config_validation.multi_select(accounts)}
+            {
+                vol.Required(CONF_ACCOUNTS): config_validation.multi_select(accounts),
+                vol.Optional(CONF_AUTO_TRACK, default=False): bool,
+            }
         )
 
         return self.async_show_form(step_id="accounts", data_schema=data_schema)
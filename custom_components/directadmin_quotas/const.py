@@ -10,6 +10,8 @@ SENSOR = "sensor"
 PLATFORMS = [SENSOR]
 
 DEFAULT_SYNC_INTERVAL = 3600  # seconds
+DEFAULT_RETRY_INTERVAL = 300  # seconds
+DEFAULT_STALE_GRACE_PERIOD = 240  # minutes
 
 CONF_HOSTNAME = "hostname"
 CONF_PORT = "port"
@@ -18,3 +20,28 @@ CONF_PASSWORD = "password"
 CONF_DOMAIN = "domain"
 
 CONF_ACCOUNTS = "accounts"
+CONF_AUTO_TRACK = "auto_track"
+CONF_KNOWN_ACCOUNTS = "known_accounts"
+CONF_STALE_GRACE_PERIOD = "stale_grace_period"
+
+# Changing any of these requires a full reload of the config entry
+CONNECTION_KEYS = [CONF_HOSTNAME, CONF_PORT, CONF_DOMAIN, CONF_USERNAME, CONF_PASSWORD]
+
+# Services
+SERVICE_START_PROFILING = "start_profiling"
+SERVICE_EXPORT_QUOTAS = "export_quotas"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_PROFILER = "profiler"
+ATTR_REFRESHES = "refreshes"
+ATTR_FORMAT = "format"
+ATTR_ACCOUNT_FILTER = "account_filter"
+ATTR_TRACKED_ONLY = "tracked_only"
+
+PROFILER_CPROFILE = "cprofile"
+PROFILER_TRACEMALLOC = "tracemalloc"
+PROFILERS = [PROFILER_CPROFILE, PROFILER_TRACEMALLOC]
+
+FORMAT_JSON = "json"
+FORMAT_CSV = "csv"
+FORMATS = [FORMAT_JSON, FORMAT_CSV]
@@ -3,11 +3,24 @@
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 import logging
+from collections.abc import Callable, Iterable
 from homeassistant import config_entries
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import UpdateFailed, DataUpdateCoordinator
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from .api import QuotasAPI
-from .const import DEFAULT_SYNC_INTERVAL, DOMAIN, CONF_ACCOUNTS
+from .profiler import RefreshProfiler
+from .const import (
+    DEFAULT_SYNC_INTERVAL,
+    DEFAULT_RETRY_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DOMAIN,
+    CONF_ACCOUNTS,
+    CONF_AUTO_TRACK,
+    CONF_KNOWN_ACCOUNTS,
+    CONF_STALE_GRACE_PERIOD,
+    CONNECTION_KEYS,
+)
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -25,6 +38,14 @@ class DirectAdminQuotasUpdateCoordinator(DataUpdateCoordinator):
         self.api = api
         self.platforms: list[str] = []
         self.last_updated = None
+        self.last_error: str | None = None
+        self.stale = False
+        self.connection_data = {
+            key: config_entry.data.get(key) for key in CONNECTION_KEYS
+        }
+        self.accounts: set[str] = set(config_entry.data.get(CONF_ACCOUNTS, []))
+        self.add_accounts_callback: Callable[[Iterable[str]], None] | None = None
+        self.profiler: RefreshProfiler | None = None
         self._hass = hass
 
         super().__init__(
@@ -35,15 +56,145 @@ class DirectAdminQuotasUpdateCoordinator(DataUpdateCoordinator):
             config_entry=config_entry,
         )
 
+    async def _async_refresh(self, *args, **kwargs) -> None:
+        """Refresh data, profiling the refresh when requested.
+
+        Overridden instead of _async_update_data, because the base class updates
+        all entities after fetching and the profile has to cover that as well.
+        """
+        if (profiler := self.profiler) is not None:
+            try:
+                profiler.start()
+            except Exception as exception:  # pylint: disable=broad-except
+                _LOGGER.error("Failed to start profiling: %s", exception)
+                profiler = self.profiler = None
+
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            if profiler is not None:
+                await self._async_stop_profiler(profiler)
+
+    async def _async_stop_profiler(self, profiler: RefreshProfiler) -> None:
+        """Stop profiling a refresh and write the results when done."""
+        try:
+            profiler.stop()
+            # Comparing memory snapshots is slow, keep it off the event loop
+            await self.hass.async_add_executor_job(profiler.collect)
+        except Exception as exception:  # pylint: disable=broad-except
+            _LOGGER.error("Failed to stop profiling: %s", exception)
+            self.profiler = None
+            return
+        if not profiler.finished:
+            return
+
+        self.profiler = None
+        try:
+            await self.hass.async_add_executor_job(profiler.write)
+        except OSError as exception:
+            _LOGGER.error("Failed to write profile to %s: %s", profiler.path, exception)
+            return
+        _LOGGER.info("Profile written to %s", profiler.path)
+
     async def _async_update_data(self):
         """Update data via library."""
         try:
-            data = {}
-            data[CONF_ACCOUNTS] = await self.api.get_quotas()
-            self.last_updated = datetime.now().replace(
-                tzinfo=ZoneInfo(self._hass.config.time_zone)
-            )
-            return data
+            quotas = await self.api.get_quotas()
         except Exception as exception:
             _LOGGER.error("Error _async_update_data: %s", exception)
-            raise UpdateFailed() from exception
+            return self._stale_data(str(exception), exception)
+
+        # get_quotas returns None on any failure, so an empty dict is real data
+        if quotas is None:
+            return self._stale_data("No quotas received")
+
+        self.stale = False
+        self.last_error = None
+        self.update_interval = timedelta(seconds=DEFAULT_SYNC_INTERVAL)
+        self.last_updated = datetime.now().replace(
+            tzinfo=ZoneInfo(self._hass.config.time_zone)
+        )
+        self._async_track_new_accounts(quotas)
+        return {CONF_ACCOUNTS: quotas}
+
+    def _within_grace_period(self) -> bool:
+        """Return if the last good data may still be served."""
+        if self.data is None or self.last_updated is None:
+            return False
+        grace_period = timedelta(
+            minutes=self.config_entry.data.get(
+                CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD
+            )
+        )
+        now = datetime.now().replace(tzinfo=ZoneInfo(self._hass.config.time_zone))
+        return now - self.last_updated <= grace_period
+
+    def _stale_data(self, error: str, exception: Exception | None = None) -> dict:
+        """Return the last good data while within the grace period."""
+        self.last_error = error
+        if not self._within_grace_period():
+            self.stale = False
+            self.update_interval = timedelta(seconds=DEFAULT_SYNC_INTERVAL)
+            raise UpdateFailed(error) from exception
+
+        # Keep serving the last good data and retry sooner in the meantime
+        _LOGGER.warning(
+            "Failed to update quotas (%s), keeping data of %s", error, self.last_updated
+        )
+        self.stale = True
+        self.update_interval = timedelta(seconds=DEFAULT_RETRY_INTERVAL)
+        return self.data
+
+    @callback
+    def async_sync_accounts(self, accounts: Iterable[str]) -> None:
+        """Add and remove tracked accounts without reloading the config entry."""
+        accounts = set(accounts)
+        added_accounts = accounts - self.accounts
+        removed_accounts = self.accounts - accounts
+        self.accounts = accounts
+
+        if removed_accounts:
+            device_registry = dr.async_get(self.hass)
+            for account in removed_accounts:
+                device = device_registry.async_get_device(
+                    identifiers={(DOMAIN, account)}
+                )
+                if device:
+                    _LOGGER.debug("Removing device: %s", device)
+                    # Detaching the device also removes its entities.
+                    device_registry.async_update_device(
+                        device_id=device.id,
+                        remove_config_entry_id=self.config_entry.entry_id,
+                    )
+
+        if added_accounts and self.add_accounts_callback:
+            _LOGGER.debug("Adding accounts: %s", sorted(added_accounts))
+            self.add_accounts_callback(added_accounts)
+
+    @callback
+    def _async_track_new_accounts(self, quotas: dict) -> None:
+        """Start tracking mailboxes not seen in earlier polls, if enabled."""
+        entry_data = self.config_entry.data
+        known_accounts = set(quotas)
+        # Stored in the entry, so it survives restarts and is only set from
+        # good polls. Deselected accounts stay known and thus untracked.
+        if CONF_KNOWN_ACCOUNTS not in entry_data:
+            new_accounts: set[str] = set()
+        else:
+            previous_accounts = set(entry_data[CONF_KNOWN_ACCOUNTS])
+            if known_accounts == previous_accounts:
+                return
+            new_accounts = known_accounts - previous_accounts - self.accounts
+            if not entry_data.get(CONF_AUTO_TRACK, False):
+                new_accounts = set()
+
+        changes: dict = {CONF_KNOWN_ACCOUNTS: sorted(known_accounts)}
+        if new_accounts:
+            _LOGGER.info("Discovered new accounts: %s", sorted(new_accounts))
+            accounts = self.accounts | new_accounts
+            self.async_sync_accounts(accounts)
+            # Persist the accounts so they stay tracked when auto tracking is disabled
+            changes[CONF_ACCOUNTS] = sorted(accounts)
+        self.hass.config_entries.async_update_entry(
+            self.config_entry, data=entry_data | changes
+        )
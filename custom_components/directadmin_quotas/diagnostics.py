@@ -0,0 +1,44 @@
+"""Diagnostics support for DirectAdmin Quotas."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_ACCOUNTS, CONF_PASSWORD, CONF_USERNAME
+from .coordinator import DirectAdminQuotasUpdateCoordinator
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: DirectAdminQuotasUpdateCoordinator = hass.data[DOMAIN][
+        config_entry.entry_id
+    ]
+    accounts = (coordinator.data or {}).get(CONF_ACCOUNTS) or {}
+    return {
+        "config_entry": async_redact_data(config_entry.data, TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_updated": (
+                coordinator.last_updated.isoformat()
+                if coordinator.last_updated
+                else None
+            ),
+            "stale": coordinator.stale,
+            "last_error": coordinator.last_error,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "tracked_accounts": len(coordinator.accounts),
+            "server_accounts": len(accounts),
+        },
+    }
@@ -0,0 +1,98 @@
+"""Profiler for the DirectAdmin Quotas refresh pipeline."""
+
+import cProfile
+import tracemalloc
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, PROFILER_CPROFILE
+
+TRACEMALLOC_TOP_STATS = 25
+
+
+class RefreshProfiler:
+    """Class to profile the next refreshes of a coordinator."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, profiler: str, refreshes: int
+    ) -> None:
+        """Initialize."""
+        self.profiler = profiler
+        self.remaining = refreshes
+        self._profile = cProfile.Profile()
+        self._results: list[str] = []
+        self._snapshots: tuple[tracemalloc.Snapshot, tracemalloc.Snapshot] | None = None
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._peak = 0
+        self._started_tracemalloc = False
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        extension = "prof" if profiler == PROFILER_CPROFILE else "txt"
+        self.path = hass.config.path(
+            f"{DOMAIN}_{entry_id}_{profiler}_{timestamp}.{extension}"
+        )
+
+    @property
+    def finished(self) -> bool:
+        """Return if all requested refreshes have been profiled."""
+        return self.remaining <= 0
+
+    def start(self) -> None:
+        """Start profiling a refresh."""
+        if self.profiler == PROFILER_CPROFILE:
+            self._profile.enable()
+            return
+        # Leave tracemalloc running if someone else started it
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        try:
+            tracemalloc.reset_peak()
+            self._snapshot = tracemalloc.take_snapshot()
+        except Exception:
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+            raise
+
+    def stop(self) -> None:
+        """Stop profiling a refresh."""
+        self.remaining -= 1
+        if self.profiler == PROFILER_CPROFILE:
+            self._profile.disable()
+            return
+        try:
+            snapshot = tracemalloc.take_snapshot()
+            _, self._peak = tracemalloc.get_traced_memory()
+        finally:
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+        if self._snapshot is not None:
+            self._snapshots = (self._snapshot, snapshot)
+        self._snapshot = None
+
+    def collect(self) -> None:
+        """Compare the snapshots of the last refresh (blocking)."""
+        if self._snapshots is None:
+            return
+        before, after = (
+            snapshot.filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+            for snapshot in self._snapshots
+        )
+        self._snapshots = None
+        stats = after.compare_to(before, "lineno")
+        lines = [
+            f"Refresh {len(self._results) + 1} at {datetime.now().isoformat()}",
+            f"Peak traced memory: {self._peak} bytes",
+        ]
+        lines.extend(str(stat) for stat in stats[:TRACEMALLOC_TOP_STATS])
+        self._results.append("\n".join(lines))
+
+    def write(self) -> None:
+        """Write the collected statistics to the file (blocking)."""
+        if self.profiler == PROFILER_CPROFILE:
+            self._profile.dump_stats(self.path)
+            return
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("\n\n".join(self._results) + "\n")
@@ -8,7 +8,9 @@ from homeassistant.components.sensor.const import (
 )
 
 
-from homeassistant.core import HomeAssistant
+from collections.abc import Iterable
+
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
@@ -95,20 +97,27 @@ async def async_setup_entry(
     coordinator: DirectAdminQuotasUpdateCoordinator = hass.data[DOMAIN][
         config_entry.entry_id
     ]
-    entities: list[AccountSensor] = []
-
-    # Add all sensors described above.
-    for account in config_entry.data.get(CONF_ACCOUNTS, []):
-        for description in get_sensor_descriptions():
-            entities.append(
-                AccountSensor(
-                    coordinator=coordinator,
-                    entry_id=config_entry.entry_id,
-                    description=description,
-                    account=account,
+
+    @callback
+    def async_add_accounts(accounts: Iterable[str]) -> None:
+        """Add all sensors described above for the given accounts."""
+        entities: list[AccountSensor] = []
+        for account in accounts:
+            for description in get_sensor_descriptions():
+                entities.append(
+                    AccountSensor(
+                        coordinator=coordinator,
+                        entry_id=config_entry.entry_id,
+                        description=description,
+                        account=account,
+                    )
                 )
-            )
-    async_add_entities(entities)
+        async_add_entities(entities)
+
+    async_add_accounts(coordinator.accounts)
+
+    # Allow the coordinator to add accounts later on without a reload.
+    coordinator.add_accounts_callback = async_add_accounts
 
 
 class AccountSensor(
@@ -139,9 +148,16 @@ class AccountSensor(
         )
         self._account = account
 
+    @property
+    def available(self) -> bool:  # type: ignore
+        """Return if the account still exists on the server."""
+        return super().available and self._account in (
+            self.coordinator.data.get(CONF_ACCOUNTS) or {}
+        )
+
     @property
     def native_value(self) -> StateType:  # type: ignore
         """Return the state of the sensor."""
-        accounts = self.coordinator.data.get(CONF_ACCOUNTS, {})
-        quota_info = accounts.get(self._account, None)
+        accounts = self.coordinator.data.get(CONF_ACCOUNTS) or {}
+        quota_info = accounts.get(self._account) or {}
         return quota_info.get(self.entity_description.key, None)
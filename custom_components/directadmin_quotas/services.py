@@ -0,0 +1,179 @@
+"""Services for the DirectAdmin quotas integration."""
+
+from __future__ import annotations
+
+import csv
+import io
+import logging
+from fnmatch import fnmatch
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    DOMAIN,
+    SERVICE_START_PROFILING,
+    SERVICE_EXPORT_QUOTAS,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_PROFILER,
+    ATTR_REFRESHES,
+    ATTR_FORMAT,
+    ATTR_ACCOUNT_FILTER,
+    ATTR_TRACKED_ONLY,
+    CONF_ACCOUNTS,
+    CONF_DOMAIN,
+    PROFILER_CPROFILE,
+    PROFILERS,
+    FORMAT_CSV,
+    FORMAT_JSON,
+    FORMATS,
+)
+from .coordinator import DirectAdminQuotasUpdateCoordinator
+from .profiler import RefreshProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+START_PROFILING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_PROFILER, default=PROFILER_CPROFILE): vol.In(PROFILERS),
+        vol.Optional(ATTR_REFRESHES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
+EXPORT_QUOTAS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_FORMAT, default=FORMAT_JSON): vol.In(FORMATS),
+        vol.Optional(ATTR_ACCOUNT_FILTER): cv.string,
+        vol.Optional(ATTR_TRACKED_ONLY, default=False): cv.boolean,
+    }
+)
+
+
+def _get_coordinator(
+    hass: HomeAssistant, entry_id: str
+) -> DirectAdminQuotasUpdateCoordinator:
+    """Return the coordinator of a loaded config entry."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    if coordinator is None:
+        raise ServiceValidationError(f"Config entry {entry_id} not found or not loaded")
+    return coordinator
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up the services for DirectAdmin quotas."""
+
+    async def async_start_profiling(call: ServiceCall) -> None:
+        """Profile the next refreshes of a config entry."""
+        entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+        coordinator = _get_coordinator(hass, entry_id)
+        # Profilers are process wide, so only one session can run at a time
+        if any(
+            other.profiler is not None for other in hass.data.get(DOMAIN, {}).values()
+        ):
+            raise ServiceValidationError("A profiling session is already active")
+        coordinator.profiler = RefreshProfiler(
+            hass,
+            entry_id=entry_id,
+            profiler=call.data[ATTR_PROFILER],
+            refreshes=call.data[ATTR_REFRESHES],
+        )
+        _LOGGER.info(
+            "Profiling the next %s refresh(es) of %s with %s",
+            call.data[ATTR_REFRESHES],
+            coordinator.config_entry.title,
+            call.data[ATTR_PROFILER],
+        )
+
+    async def async_export_quotas(call: ServiceCall) -> ServiceResponse:
+        """Return the current quotas of one or all config entries."""
+        if entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID):
+            coordinators = [_get_coordinator(hass, entry_id)]
+        else:
+            coordinators = list(hass.data.get(DOMAIN, {}).values())
+
+        # Served from the coordinator data, DirectAdmin isn't contacted
+        entries = [
+            _export_entry(
+                coordinator,
+                account_filter=call.data.get(ATTR_ACCOUNT_FILTER),
+                tracked_only=call.data[ATTR_TRACKED_ONLY],
+            )
+            for coordinator in coordinators
+        ]
+        if call.data[ATTR_FORMAT] == FORMAT_CSV:
+            return {"csv": _entries_to_csv(entries)}
+        return {"entries": entries}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_PROFILING,
+        async_start_profiling,
+        schema=START_PROFILING_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_QUOTAS,
+        async_export_quotas,
+        schema=EXPORT_QUOTAS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _export_entry(
+    coordinator: DirectAdminQuotasUpdateCoordinator,
+    account_filter: str | None,
+    tracked_only: bool,
+) -> dict:
+    """Return the quotas snapshot of a coordinator."""
+    quotas = (coordinator.data or {}).get(CONF_ACCOUNTS) or {}
+    accounts = {
+        account: info
+        for account, info in sorted(quotas.items())
+        if (not tracked_only or account in coordinator.accounts)
+        and (not account_filter or fnmatch(account, account_filter))
+    }
+    return {
+        ATTR_CONFIG_ENTRY_ID: coordinator.config_entry.entry_id,
+        CONF_DOMAIN: coordinator.config_entry.data.get(CONF_DOMAIN),
+        "last_updated": (
+            coordinator.last_updated.isoformat() if coordinator.last_updated else None
+        ),
+        "stale": coordinator.stale,
+        CONF_ACCOUNTS: accounts,
+    }
+
+
+def _entries_to_csv(entries: list[dict]) -> str:
+    """Return the exported entries as CSV, one row per account."""
+    keys: dict[str, None] = {}
+    for entry in entries:
+        for info in entry[CONF_ACCOUNTS].values():
+            keys.update(dict.fromkeys(info))
+
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow([CONF_DOMAIN, "account", *keys, "last_updated", "stale"])
+    for entry in entries:
+        for account, info in entry[CONF_ACCOUNTS].items():
+            writer.writerow(
+                [
+                    entry[CONF_DOMAIN],
+                    account,
+                    *(info.get(key) for key in keys),
+                    entry["last_updated"],
+                    entry["stale"],
+                ]
+            )
+    return output.getvalue()